@@ -4,6 +4,100 @@ sg-spec Contracts
 Canonical contract definitions for Smart Guitar runtime capabilities.
 """
 
-from .schemas import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from . import schemas as _schemas
 
 __version__ = "1.0.0"
+
+# Static view of the lazy re-exports for type checkers; keep in sync with schemas._LAZY
+if TYPE_CHECKING:
+    from .schemas import sandbox_schemas, smart_guitar
+    from .schemas import (
+        SmartGuitarStatus,
+        MidiProtocol,
+        AudioOutput,
+        MidiProtocolValue,
+        AudioOutputValue,
+        ToolpathType,
+        SmartGuitarComponent,
+        SmartGuitarIoT,
+        SmartGuitarConnectivity,
+        SmartGuitarAudio,
+        SmartGuitarSensors,
+        SmartGuitarPower,
+        SmartGuitarCamFeatures,
+        SmartGuitarToolpath,
+        SmartGuitarHardware,
+        SmartGuitarSoftware,
+        SmartGuitarArchitecture,
+        SmartGuitarInfo,
+        DawPartner,
+        SmartGuitarDawIntegration,
+        SmartGuitarRegistryEntry,
+        SmartGuitarHealthResponse,
+        SmartGuitarToolpathsResponse,
+        SmartGuitarResource,
+        SmartGuitarBundleResponse,
+        SMART_GUITAR_FEATURES,
+        SMART_GUITAR_COMPONENTS,
+        get_default_registry_entry,
+        get_default_info,
+        get_default_health,
+        get_default_bundle,
+        get_default_toolpaths,
+        get_default_health_json,
+        get_default_info_json,
+        get_default_bundle_json,
+        get_default_toolpaths_json,
+        CONTRACT_VERSION,
+        ModelVariant,
+        Handedness,
+        Connectivity,
+        Feature,
+        UnitSystem,
+        Vec2,
+        BBox3D,
+        Clearance,
+        Mounting,
+        ElectronicsComponent,
+        PowerSpec,
+        ThermalSpec,
+        BodyDims,
+        SmartGuitarSpec,
+        PlanWarning,
+        PlanError,
+        CavityKind,
+        CavityPlan,
+        ChannelKind,
+        ChannelPlan,
+        BracketPlan,
+        ToolpathOp,
+        SmartCamPlan,
+        DEFAULT_TOOLPATHS,
+        ELECTRONICS_LIST_ADAPTER,
+        CAVITY_LIST_ADAPTER,
+        TOOLPATH_OP_LIST_ADAPTER,
+        parse_electronics_json,
+        parse_cavities_json,
+        parse_toolpath_ops_json,
+    )
+
+__all__ = list(_schemas.__all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _schemas._SUBMODULES:
+        module = import_module(f".schemas.{name}", __name__)
+        globals()[name] = module
+        return module
+    if name in _schemas._LAZY:
+        value = getattr(_schemas, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_schemas.__all__) | _schemas._SUBMODULES)
@@ -4,15 +4,21 @@ Smart Guitar Pydantic Models
 
 Contract definitions for Smart Guitar instruments.
 
+JSON ingestion: feed raw request bytes to ``Model.parse_json`` (or
+``model_validate_json``) rather than ``model_validate(json.loads(...))``,
+which builds an intermediate dict and then walks it a second time.
+
 Version: 1.0.0
 """
 
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Literal, Optional
+from functools import lru_cache, partial
+from typing import List, Literal, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
 
 
 # =============================================================================
@@ -37,6 +43,13 @@ class AudioOutput(str, Enum):
     WIRELESS = "wireless"
 
 
+# Field types for the list-valued subsystem fields. pydantic-core validates a
+# Literal with a direct value lookup, cheaper per element than an Enum. The
+# Enums above remain the named constants; keep the value sets in sync.
+MidiProtocolValue = Literal["usb", "wireless", "din"]
+AudioOutputValue = Literal["analog", "usb", "wireless"]
+
+
 class ToolpathType(str, Enum):
     POCKET = "pocket"
     DRILL = "drill"
@@ -51,12 +64,45 @@ class SmartGuitarComponent(str, Enum):
     ANTENNA = "antenna"
 
 
+# =============================================================================
+# DEFAULT VALUES
+# =============================================================================
+# Immutable prototypes; default factories copy them with a single list()/dict()
+# call instead of running a lambda that rebuilds the container per instance.
+
+# Spelled as literals (MidiProtocol / AudioOutput values) so type checkers see
+# the Literal element types of the fields they default.
+_DEFAULT_MIDI: Tuple[MidiProtocolValue, ...] = ("usb", "wireless")
+
+_DEFAULT_AUDIO_OUTPUTS: Tuple[AudioOutputValue, ...] = ("analog", "usb", "wireless")
+
+_DEFAULT_FEATURES = (
+    "temperament_support",
+    "led_markers",
+    "effects_processing",
+    "wireless_audio",
+    "midi_output",
+)
+
+_DEFAULT_RELATED_ENDPOINTS = {
+    "spec": "/api/instruments/guitar/smart/spec",
+    "cam": "/api/cam/guitar/smart/health",
+}
+
+_DEFAULT_CAPABILITIES = ("toolpaths", "preview")
+
+
 # =============================================================================
 # SUBSYSTEMS
 # =============================================================================
+# Subsystem models are frozen so a single default instance can be shared by
+# every registry entry; override by assigning a new instance, e.g.
+# entry.iot = SmartGuitarIoT(memory_gb=4).
 
 class SmartGuitarIoT(BaseModel):
     """Compute specifications."""
+    model_config = ConfigDict(frozen=True)
+
     processor: str = "embedded_host"
     memory_gb: int = 0
     storage_gb: int = 0
@@ -65,27 +111,26 @@ class SmartGuitarIoT(BaseModel):
 
 class SmartGuitarConnectivity(BaseModel):
     """Connectivity options."""
+    model_config = ConfigDict(frozen=True)
+
     wired: bool = True
     wireless: bool = True
-    midi: List[MidiProtocol] = Field(default_factory=lambda: [
-        MidiProtocol.USB_MIDI,
-        MidiProtocol.WIRELESS_MIDI,
-    ])
+    midi: Tuple[MidiProtocolValue, ...] = _DEFAULT_MIDI
 
 
 class SmartGuitarAudio(BaseModel):
     """Audio subsystem."""
+    model_config = ConfigDict(frozen=True)
+
     quality: str = "high_resolution"
     latency: str = "low"
-    outputs: List[AudioOutput] = Field(default_factory=lambda: [
-        AudioOutput.ANALOG,
-        AudioOutput.USB_AUDIO,
-        AudioOutput.WIRELESS,
-    ])
+    outputs: Tuple[AudioOutputValue, ...] = _DEFAULT_AUDIO_OUTPUTS
 
 
 class SmartGuitarSensors(BaseModel):
     """Sensor specifications."""
+    model_config = ConfigDict(frozen=True)
+
     pickups: bool = True
     motion: bool = True
     touch: bool = True
@@ -93,6 +138,8 @@ class SmartGuitarSensors(BaseModel):
 
 class SmartGuitarPower(BaseModel):
     """Power system."""
+    model_config = ConfigDict(frozen=True)
+
     battery: bool = True
     runtime: str = "extended"
 
@@ -103,6 +150,8 @@ class SmartGuitarPower(BaseModel):
 
 class SmartGuitarCamFeatures(BaseModel):
     """CAM manufacturing features."""
+    model_config = ConfigDict(frozen=True)
+
     electronics_cavity: str = "routed"
     control_panel: str = "machined"
     pcb_mounting: str = "standoffs"
@@ -131,17 +180,52 @@ class SmartGuitarSpec(BaseModel):
     string_count: int = 6
     description: str = "Connected electric guitar"
 
+    @classmethod
+    def parse_json(cls, data: Union[str, bytes, bytearray]) -> SmartGuitarSpec:
+        """Parse and validate a raw JSON body in a single pydantic-core pass."""
+        return cls.model_validate_json(data)
+
+
+class SmartGuitarHardware(TypedDict, total=False):
+    """Hardware architecture summary."""
+    __pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[misc]
+
+    compute: str
+    connectivity: List[str]
+    audio: str
+
+
+class SmartGuitarSoftware(TypedDict, total=False):
+    """Software architecture summary."""
+    __pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[misc]
+
+    os: str
+
+
+_DEFAULT_HARDWARE: SmartGuitarHardware = {
+    "compute": "embedded",
+    "connectivity": ["wired", "wireless"],
+    "audio": "high_resolution",
+}
+
+_DEFAULT_SOFTWARE: SmartGuitarSoftware = {
+    "os": "linux",
+}
+
+
+def _default_hardware() -> SmartGuitarHardware:
+    # Shallow dict copy plus a fresh connectivity list; much cheaper than deepcopy
+    return {**_DEFAULT_HARDWARE, "connectivity": list(_DEFAULT_HARDWARE["connectivity"])}
+
+
+def _default_software() -> SmartGuitarSoftware:
+    return {**_DEFAULT_SOFTWARE}
+
 
 class SmartGuitarArchitecture(BaseModel):
     """Architecture specification."""
-    hardware: dict = Field(default_factory=lambda: {
-        "compute": "embedded",
-        "connectivity": ["wired", "wireless"],
-        "audio": "high_resolution",
-    })
-    software: dict = Field(default_factory=lambda: {
-        "os": "linux",
-    })
+    hardware: SmartGuitarHardware = Field(default_factory=_default_hardware)
+    software: SmartGuitarSoftware = Field(default_factory=_default_software)
 
 
 class SmartGuitarInfo(BaseModel):
@@ -153,10 +237,9 @@ class SmartGuitarInfo(BaseModel):
     architecture: SmartGuitarArchitecture = Field(
         default_factory=SmartGuitarArchitecture
     )
-    related_endpoints: dict = Field(default_factory=lambda: {
-        "spec": "/api/instruments/guitar/smart/spec",
-        "cam": "/api/cam/guitar/smart/health",
-    })
+    related_endpoints: dict = Field(
+        default_factory=partial(dict, _DEFAULT_RELATED_ENDPOINTS)
+    )
 
 
 class DawPartner(BaseModel):
@@ -167,9 +250,19 @@ class DawPartner(BaseModel):
 
 class SmartGuitarDawIntegration(BaseModel):
     """DAW integration."""
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
 
 
+_DEFAULT_IOT = SmartGuitarIoT()
+_DEFAULT_CONNECTIVITY = SmartGuitarConnectivity()
+_DEFAULT_AUDIO = SmartGuitarAudio()
+_DEFAULT_SENSORS = SmartGuitarSensors()
+_DEFAULT_POWER = SmartGuitarPower()
+_DEFAULT_CAM_FEATURES = SmartGuitarCamFeatures()
+
+
 # =============================================================================
 # FULL REGISTRY ENTRY
 # =============================================================================
@@ -184,23 +277,18 @@ class SmartGuitarRegistryEntry(BaseModel):
     fret_count: int = 24
     string_count: int = 6
     description: str = "Connected electric guitar"
-    iot: SmartGuitarIoT = Field(default_factory=SmartGuitarIoT)
-    connectivity: SmartGuitarConnectivity = Field(
-        default_factory=SmartGuitarConnectivity
-    )
-    audio: SmartGuitarAudio = Field(default_factory=SmartGuitarAudio)
-    sensors: SmartGuitarSensors = Field(default_factory=SmartGuitarSensors)
-    power: SmartGuitarPower = Field(default_factory=SmartGuitarPower)
-    features: List[str] = Field(default_factory=lambda: [
-        "temperament_support",
-        "led_markers",
-        "effects_processing",
-        "wireless_audio",
-        "midi_output",
-    ])
-    cam_features: SmartGuitarCamFeatures = Field(
-        default_factory=SmartGuitarCamFeatures
-    )
+    iot: SmartGuitarIoT = _DEFAULT_IOT
+    connectivity: SmartGuitarConnectivity = _DEFAULT_CONNECTIVITY
+    audio: SmartGuitarAudio = _DEFAULT_AUDIO
+    sensors: SmartGuitarSensors = _DEFAULT_SENSORS
+    power: SmartGuitarPower = _DEFAULT_POWER
+    features: List[str] = Field(default_factory=partial(list, _DEFAULT_FEATURES))
+    cam_features: SmartGuitarCamFeatures = _DEFAULT_CAM_FEATURES
+
+    @classmethod
+    def parse_json(cls, data: Union[str, bytes, bytearray]) -> SmartGuitarRegistryEntry:
+        """Parse and validate a raw JSON body in a single pydantic-core pass."""
+        return cls.model_validate_json(data)
 
 
 # =============================================================================
@@ -212,10 +300,9 @@ class SmartGuitarHealthResponse(BaseModel):
     ok: bool = True
     subsystem: Literal["smart_guitar_cam"] = "smart_guitar_cam"
     model_id: Literal["smart"] = "smart"
-    capabilities: List[str] = Field(default_factory=lambda: [
-        "toolpaths",
-        "preview",
-    ])
+    capabilities: List[str] = Field(
+        default_factory=partial(list, _DEFAULT_CAPABILITIES)
+    )
 
 
 class SmartGuitarToolpathsResponse(BaseModel):
@@ -238,18 +325,17 @@ class SmartGuitarBundleResponse(BaseModel):
     bundle_version: str = "1.0"
     resources: List[SmartGuitarResource] = Field(default_factory=list)
 
+    @classmethod
+    def parse_json(cls, data: Union[str, bytes, bytearray]) -> SmartGuitarBundleResponse:
+        """Parse and validate a raw JSON body in a single pydantic-core pass."""
+        return cls.model_validate_json(data)
+
 
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
-SMART_GUITAR_FEATURES: List[str] = [
-    "temperament_support",
-    "led_markers",
-    "effects_processing",
-    "wireless_audio",
-    "midi_output",
-]
+SMART_GUITAR_FEATURES: List[str] = list(_DEFAULT_FEATURES)
 
 SMART_GUITAR_COMPONENTS: List[SmartGuitarComponent] = [
     SmartGuitarComponent.ELECTRONICS_CAVITY,
@@ -279,3 +365,69 @@ DEFAULT_TOOLPATHS: List[SmartGuitarToolpath] = [
         component=SmartGuitarComponent.LED_CHANNEL,
     ),
 ]
+
+
+# =============================================================================
+# CACHED DEFAULT RESPONSES
+# =============================================================================
+# All-default responses are identical on every call, so each is built once per
+# process. The returned instance is shared and must not be mutated: its list
+# and dict fields are shared too, and model_copy(update=...) is shallow. Take
+# a private copy with model_copy(deep=True) before changing anything. The
+# *_json variants cache the serialized body of a freshly built response, so
+# static endpoints can return the bytes directly and the bytes never depend on
+# the shared instances above.
+
+@lru_cache(maxsize=None)
+def get_default_registry_entry() -> SmartGuitarRegistryEntry:
+    """Shared all-default registry entry. Read-only: use model_copy(deep=True)."""
+    return SmartGuitarRegistryEntry()
+
+
+@lru_cache(maxsize=None)
+def get_default_info() -> SmartGuitarInfo:
+    """Shared all-default info response. Read-only: use model_copy(deep=True)."""
+    return SmartGuitarInfo()
+
+
+@lru_cache(maxsize=None)
+def get_default_health() -> SmartGuitarHealthResponse:
+    """Shared all-default health response. Read-only: use model_copy(deep=True)."""
+    return SmartGuitarHealthResponse()
+
+
+@lru_cache(maxsize=None)
+def get_default_bundle() -> SmartGuitarBundleResponse:
+    """Shared all-default bundle response. Read-only: use model_copy(deep=True)."""
+    return SmartGuitarBundleResponse()
+
+
+@lru_cache(maxsize=None)
+def get_default_toolpaths() -> SmartGuitarToolpathsResponse:
+    """Shared DEFAULT_TOOLPATHS response. Read-only: use model_copy(deep=True)."""
+    return SmartGuitarToolpathsResponse(toolpaths=DEFAULT_TOOLPATHS)
+
+
+@lru_cache(maxsize=None)
+def get_default_health_json() -> bytes:
+    """Serialized all-default health body, built from a fresh instance."""
+    return SmartGuitarHealthResponse().model_dump_json().encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_default_info_json() -> bytes:
+    """Serialized all-default info body, built from a fresh instance."""
+    return SmartGuitarInfo().model_dump_json().encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_default_bundle_json() -> bytes:
+    """Serialized all-default bundle body, built from a fresh instance."""
+    return SmartGuitarBundleResponse().model_dump_json().encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_default_toolpaths_json() -> bytes:
+    """Serialized all-default toolpaths body, built from a fresh instance."""
+    body = SmartGuitarToolpathsResponse(toolpaths=DEFAULT_TOOLPATHS)
+    return body.model_dump_json().encode("utf-8")
@@ -0,0 +1,91 @@
+"""
+Unit tests for the PEP 562 lazy re-exports in contracts and contracts.schemas
+
+Lives beside the package because contracts/ is repo-only and is not shipped
+in the sg_spec wheel.
+
+Run with: python -m pytest contracts/test_lazy_exports.py -v
+"""
+
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import contracts
+import contracts.schemas
+
+
+def _lazy_entries(package):
+    return [
+        pytest.param(package, name, module, id=f"{package.__name__}.{name}")
+        for name, module in package._LAZY.items()
+    ]
+
+
+def _type_checking_imports(package):
+    """Map name -> submodule for the imports under `if TYPE_CHECKING:`."""
+    tree = ast.parse(Path(package.__file__).read_text(encoding="utf-8"))
+    block = next(
+        node for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+    return {
+        alias.name: stmt.module
+        for stmt in block.body
+        if isinstance(stmt, ast.ImportFrom)
+        for alias in stmt.names
+    }
+
+
+class TestContractsLazyExports:
+    """contracts.schemas and contracts resolve every _LAZY name."""
+
+    @pytest.mark.parametrize("package, name, module", _lazy_entries(contracts.schemas))
+    def test_entry_resolves(self, package, name, module):
+        submodule = importlib.import_module(f"{package.__name__}.{module}")
+        assert getattr(package, name) is getattr(submodule, name)
+        assert getattr(contracts, name) is getattr(submodule, name)
+
+    def test_all_matches_lazy(self):
+        assert contracts.schemas.__all__ == list(contracts.schemas._LAZY)
+        assert contracts.__all__ == contracts.schemas.__all__
+
+    def test_type_checking_blocks_match_lazy(self):
+        lazy = contracts.schemas._LAZY
+        assert _type_checking_imports(contracts.schemas) == lazy
+        expected = {name: "schemas" for name in lazy}
+        expected.update((sub, "schemas") for sub in contracts.schemas._SUBMODULES)
+        assert _type_checking_imports(contracts) == expected
+
+    @pytest.mark.parametrize("name", ["smart_guitar", "sandbox_schemas"])
+    def test_submodules_resolve_as_attributes(self, name):
+        submodule = importlib.import_module(f"contracts.schemas.{name}")
+        assert getattr(contracts.schemas, name) is submodule
+        assert getattr(contracts, name) is submodule
+        assert name in dir(contracts.schemas)
+        assert name in dir(contracts)
+
+    def test_submodules_resolve_in_fresh_interpreter(self):
+        """Attribute access alone (no prior submodule import) must resolve."""
+        code = (
+            "import contracts, types; "
+            "assert isinstance(contracts.smart_guitar, types.ModuleType); "
+            "assert isinstance(contracts.schemas.sandbox_schemas, types.ModuleType)"
+        )
+        repo_root = Path(contracts.__file__).resolve().parent.parent
+        subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            contracts.NoSuchSchema
+        with pytest.raises(AttributeError):
+            contracts.schemas.NoSuchSchema
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -23,15 +23,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 
 
-HEX64_RE = re.compile(r"^[0-9a-f]{64}$")
+LOWER_HEX = b"0123456789abcdef"
+
+# Token-safe boundary: avoid partial matches like cam_policy in cam_policy_extended
+_STEM_BOUNDARY = r"(?<![A-Za-z0-9_]){}(?![A-Za-z0-9_])"
+_STEM_RE_CACHE: Dict[str, "re.Pattern[str]"] = {}
 
 
 @dataclass
@@ -40,18 +45,24 @@ class Violation:
     message: str
 
 
-def run_git(args: List[str], cwd: Path) -> str:
-    p = subprocess.run(["git", *args], cwd=str(cwd), capture_output=True, text=True)
+def run_git_bytes(args: List[str], cwd: Path) -> bytes:
+    p = subprocess.run(["git", *args], cwd=str(cwd), capture_output=True)
     if p.returncode != 0:
-        raise RuntimeError(f"git {' '.join(args)} failed:\n{p.stdout}\n{p.stderr}")
-    return p.stdout.strip()
+        out = p.stdout.decode("utf-8", errors="replace")
+        err = p.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"git {' '.join(args)} failed:\n{out}\n{err}")
+    return p.stdout
+
+
+def run_git(args: List[str], cwd: Path) -> str:
+    return run_git_bytes(args, cwd).decode("utf-8", errors="surrogateescape").strip()
 
 
 def changed_files(repo_root: Path, base_ref: str) -> List[str]:
-    # Use three-dot to compare merge-base(base_ref, HEAD)..HEAD (typical PR diff)
-    out = run_git(["diff", "--name-only", f"{base_ref}...HEAD"], cwd=repo_root)
-    files = [x.strip() for x in out.splitlines() if x.strip()]
-    return files
+    # Use three-dot to compare merge-base(base_ref, HEAD)..HEAD (typical PR diff).
+    # -z: NUL-separated, unquoted paths (no core.quotepath escaping, newline-safe)
+    raw = run_git_bytes(["diff", "--name-only", "-z", f"{base_ref}...HEAD"], cwd=repo_root)
+    return [p.decode("utf-8", errors="surrogateescape") for p in raw.split(b"\0") if p]
 
 
 def read_contracts_version(repo_root: Path) -> Tuple[bool, str]:
@@ -80,42 +91,72 @@ def is_contract_sha(path: str) -> bool:
     return path.startswith("contracts/") and path.endswith(".schema.sha256")
 
 
+def contract_files(changed: Iterable[str]) -> List[str]:
+    return sorted(p for p in changed if is_contract_schema(p) or is_contract_sha(p))
+
+
 def contract_stem(path: str) -> str:
     # contracts/foo_v1.schema.json -> foo_v1
-    name = Path(path).name
-    if name.endswith(".schema.json"):
-        return name[: -len(".schema.json")]
-    if name.endswith(".schema.sha256"):
-        return name[: -len(".schema.sha256")]
-    return name
+    name = path.rpartition("/")[2]
+    stem = name.removesuffix(".schema.json")
+    return stem if len(stem) != len(name) else name.removesuffix(".schema.sha256")
 
 
 def is_v1_contract(path: str) -> bool:
     # matches *_v1.schema.json or *_v1.schema.sha256
-    return bool(re.search(r"_v1\.schema\.(json|sha256)$", path))
+    return path.endswith(("_v1.schema.json", "_v1.schema.sha256"))
+
+
+def stem_mentioned(text: str, stem: str) -> bool:
+    pat = _STEM_RE_CACHE.get(stem)
+    if pat is None:
+        pat = _STEM_RE_CACHE[stem] = re.compile(_STEM_BOUNDARY.format(re.escape(stem)))
+    return pat.search(text) is not None
+
+
+def mentioned_stems(text: str, stems: Iterable[str]) -> Set[str]:
+    """Return the stems mentioned in text, scanning it once for all of them."""
+    stems = sorted(set(stems), key=len, reverse=True)
+    if not stems:
+        return set()
+    alternation = "(" + "|".join(re.escape(s) for s in stems) + ")"
+    combined = re.compile(_STEM_BOUNDARY.format(alternation))
+    found = {m.group(1) for m in combined.finditer(text)}
+    # finditer reports one stem per position and never overlaps matches, so a
+    # stem shadowed by another (e.g. "bar" inside "foo.bar") is confirmed alone.
+    found.update(s for s in stems if s not in found and stem_mentioned(text, s))
+    return found
 
 
 def check_sha256_format(repo_root: Path) -> List[Violation]:
     v: List[Violation] = []
     contracts_dir = repo_root / "contracts"
-    if not contracts_dir.exists():
+    if not contracts_dir.is_dir():
         return v
-    for fp in contracts_dir.glob("*.schema.sha256"):
-        raw = fp.read_text(encoding="utf-8").strip()
-        if not HEX64_RE.match(raw):
+    with os.scandir(contracts_dir) as it:
+        sha_files = sorted(
+            e.path for e in it if e.name.endswith(".schema.sha256") and e.is_file()
+        )
+    for path in sha_files:
+        with open(path, "rb") as f:
+            raw = f.read().strip()
+        # Fixed-width check on bytes: no UTF-8 decode, no regex
+        if len(raw) != 64 or raw.translate(None, LOWER_HEX):
+            got = raw.decode("utf-8", errors="replace")
             v.append(
                 Violation(
                     "SHA256_FORMAT",
-                    f"{fp.as_posix()} must contain exactly one 64-lowercase-hex line; got: {raw!r}",
+                    f"{Path(path).as_posix()} must contain exactly one 64-lowercase-hex line; got: {got!r}",
                 )
             )
     return v
 
 
-def check_changelog_required(repo_root: Path, changed: List[str], base_ref: str) -> List[Violation]:
+def check_changelog_required(
+    repo_root: Path, changed: Set[str], contract_changes: List[str], base_ref: str
+) -> List[Violation]:
     v: List[Violation] = []
 
-    contract_changes = [p for p in changed if is_contract_schema(p) or is_contract_sha(p)]
     if not contract_changes:
         return v
 
@@ -130,20 +171,20 @@ def check_changelog_required(repo_root: Path, changed: List[str], base_ref: str)
 
     # Require stems to appear in the *added lines* of the changelog diff for this PR.
     # Deleted mentions must NOT satisfy the "document your change" rule.
-    raw_diff = run_git(["diff", f"{base_ref}...HEAD", "--", "contracts/CHANGELOG.md"], cwd=repo_root)
+    # Only reached when contracts and CHANGELOG.md both changed; --unified=0 drops
+    # context lines, which are never inspected.
+    raw_diff = run_git(
+        ["diff", "--unified=0", "--no-ext-diff", f"{base_ref}...HEAD", "--", "contracts/CHANGELOG.md"],
+        cwd=repo_root,
+    )
     added_only = "\n".join(
         ln[1:] for ln in raw_diff.splitlines()
         if ln.startswith("+") and not ln.startswith("+++ ")
     )
 
     stems = sorted({contract_stem(p) for p in contract_changes})
-
-    def stem_mentioned(text: str, stem: str) -> bool:
-        # Token-safe match: avoid partial matches like cam_policy in cam_policy_extended
-        pat = re.compile(rf"(?<![A-Za-z0-9_]){re.escape(stem)}(?![A-Za-z0-9_])")
-        return pat.search(text) is not None
-
-    missing = [s for s in stems if not stem_mentioned(added_only, s)]
+    found = mentioned_stems(added_only, stems)
+    missing = [s for s in stems if s not in found]
 
     if missing:
         v.append(
@@ -157,13 +198,13 @@ def check_changelog_required(repo_root: Path, changed: List[str], base_ref: str)
     return v
 
 
-def check_v1_immutability(repo_root: Path, changed: List[str]) -> List[Violation]:
+def check_v1_immutability(repo_root: Path, contract_changes: List[str]) -> List[Violation]:
     v: List[Violation] = []
     public, tag = read_contracts_version(repo_root)
     if not public:
         return v
 
-    v1_touched = [p for p in changed if (is_contract_schema(p) or is_contract_sha(p)) and is_v1_contract(p)]
+    v1_touched = [p for p in contract_changes if is_v1_contract(p)]
     if v1_touched:
         v.append(
             Violation(
@@ -189,7 +230,8 @@ def main() -> int:
     repo_root = Path(args.repo_root).resolve()
 
     try:
-        changed = changed_files(repo_root, args.base_ref)
+        # Deduplicated once; the checks only test membership
+        changed = set(changed_files(repo_root, args.base_ref))
     except Exception as e:
         print(f"[contracts-gov] ERROR: {e}", file=sys.stderr)
         return 2
@@ -197,8 +239,9 @@ def main() -> int:
     violations: List[Violation] = []
     try:
         violations.extend(check_sha256_format(repo_root))
-        violations.extend(check_changelog_required(repo_root, changed, args.base_ref))
-        violations.extend(check_v1_immutability(repo_root, changed))
+        contract_changes = contract_files(changed)
+        violations.extend(check_changelog_required(repo_root, changed, contract_changes, args.base_ref))
+        violations.extend(check_v1_immutability(repo_root, contract_changes))
     except Exception as e:
         print(f"[contracts-gov] ERROR: {e}", file=sys.stderr)
         return 2
@@ -5,17 +5,18 @@ Unit tests for check_contracts_governance.py
 Run with: python -m pytest scripts/ci/test_check_contracts_governance.py -v
 """
 
-import re
-import pytest
+import subprocess
 
+import pytest
 
-def stem_mentioned(text: str, stem: str) -> bool:
-    """
-    Token-safe match: avoid partial matches like cam_policy in cam_policy_extended.
-    Copied from check_contracts_governance.py for isolated testing.
-    """
-    pat = re.compile(rf"(?<![A-Za-z0-9_]){re.escape(stem)}(?![A-Za-z0-9_])")
-    return pat.search(text) is not None
+from check_contracts_governance import (
+    changed_files,
+    check_sha256_format,
+    contract_stem,
+    is_v1_contract,
+    mentioned_stems,
+    stem_mentioned,
+)
 
 
 class TestStemMentioned:
@@ -137,5 +138,122 @@ class TestStemMentioned:
         assert stem_mentioned("schema.v1 updated", "schema.v1") is True
 
 
+class TestMentionedStems:
+    """mentioned_stems must agree with stem_mentioned for every stem."""
+
+    def test_all_found(self):
+        text = "- cam_policy: tightened\n- qa_core: fixed"
+        assert mentioned_stems(text, ["cam_policy", "qa_core"]) == {"cam_policy", "qa_core"}
+
+    def test_partial_not_found(self):
+        text = "cam_policy_extended added"
+        assert mentioned_stems(text, ["cam_policy", "qa_core"]) == set()
+
+    def test_prefix_stems(self):
+        """A stem that prefixes another must not steal its match."""
+        text = "viewer_pack_v1 updated"
+        assert mentioned_stems(text, ["viewer_pack", "viewer_pack_v1"]) == {"viewer_pack_v1"}
+
+    def test_overlapping_stems(self):
+        """A stem contained in another stem's match is still detected."""
+        text = "schema.v1 updated"
+        assert mentioned_stems(text, ["schema.v1", "v1"]) == {"schema.v1", "v1"}
+
+    def test_empty(self):
+        assert mentioned_stems("cam_policy", []) == set()
+        assert mentioned_stems("", ["cam_policy"]) == set()
+
+
+class TestContractStem:
+    """Stem extraction from contract paths."""
+
+    def test_schema_and_sha(self):
+        assert contract_stem("contracts/foo_v1.schema.json") == "foo_v1"
+        assert contract_stem("contracts/foo_v1.schema.sha256") == "foo_v1"
+
+    def test_only_one_suffix_stripped(self):
+        assert contract_stem("contracts/foo.schema.sha256.schema.json") == "foo.schema.sha256"
+
+    def test_other_names_unchanged(self):
+        assert contract_stem("contracts/CHANGELOG.md") == "CHANGELOG.md"
+        assert contract_stem("foo.schema.json") == "foo"
+
+
+class TestIsV1Contract:
+    """Suffix matching for immutable v1 contract files."""
+
+    def test_v1_schema_and_sha(self):
+        assert is_v1_contract("contracts/viewer_pack_v1.schema.json") is True
+        assert is_v1_contract("contracts/viewer_pack_v1.schema.sha256") is True
+
+    def test_unversioned_and_other_versions(self):
+        assert is_v1_contract("contracts/cam_policy.schema.json") is False
+        assert is_v1_contract("contracts/viewer_pack_v2.schema.json") is False
+        assert is_v1_contract("contracts/viewer_pack_v11.schema.json") is False
+
+    def test_suffix_must_be_at_end(self):
+        assert is_v1_contract("contracts/viewer_pack_v1.schema.json.bak") is False
+
+
+class TestCheckSha256Format:
+    """Format check over contracts/*.schema.sha256."""
+
+    GOOD = "a" * 64
+
+    def _write(self, root, name, data):
+        d = root / "contracts"
+        d.mkdir(exist_ok=True)
+        (d / name).write_bytes(data)
+
+    def test_valid_with_trailing_newline(self, tmp_path):
+        self._write(tmp_path, "x_v1.schema.sha256", (self.GOOD + "\n").encode())
+        assert check_sha256_format(tmp_path) == []
+
+    def test_uppercase_rejected(self, tmp_path):
+        self._write(tmp_path, "x_v1.schema.sha256", self.GOOD.upper().encode())
+        assert [v.code for v in check_sha256_format(tmp_path)] == ["SHA256_FORMAT"]
+
+    def test_wrong_length_rejected(self, tmp_path):
+        self._write(tmp_path, "x_v1.schema.sha256", (self.GOOD + "a").encode())
+        assert [v.code for v in check_sha256_format(tmp_path)] == ["SHA256_FORMAT"]
+
+    def test_two_lines_rejected(self, tmp_path):
+        self._write(tmp_path, "x_v1.schema.sha256", (self.GOOD + "\n" + self.GOOD).encode())
+        assert [v.code for v in check_sha256_format(tmp_path)] == ["SHA256_FORMAT"]
+
+    def test_non_utf8_reported_not_raised(self, tmp_path):
+        self._write(tmp_path, "x_v1.schema.sha256", b"\xff\xfe")
+        assert [v.code for v in check_sha256_format(tmp_path)] == ["SHA256_FORMAT"]
+
+    def test_other_files_ignored(self, tmp_path):
+        self._write(tmp_path, "x_v1.schema.json", b"{}")
+        assert check_sha256_format(tmp_path) == []
+
+    def test_missing_contracts_dir(self, tmp_path):
+        assert check_sha256_format(tmp_path) == []
+
+
+class TestChangedFiles:
+    """changed_files reads NUL-separated, unquoted paths from git."""
+
+    def _git(self, root, *args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=root, check=True, capture_output=True,
+        )
+
+    def test_non_ascii_and_spaces(self, tmp_path):
+        self._git(tmp_path, "init", "-q")
+        (tmp_path / "base.txt").write_text("x")
+        self._git(tmp_path, "add", "-A")
+        self._git(tmp_path, "commit", "-qm", "base")
+        self._git(tmp_path, "branch", "base")
+        (tmp_path / "contracts").mkdir()
+        (tmp_path / "contracts" / "caf\u00e9 v1.schema.json").write_text("{}")
+        self._git(tmp_path, "add", "-A")
+        self._git(tmp_path, "commit", "-qm", "change")
+        assert changed_files(tmp_path, "base") == ["contracts/caf\u00e9 v1.schema.json"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -25,15 +25,285 @@ Usage:
 
     # Practice assignment (Phase 5.2)
     from sg_spec.schemas.practice_assignment import PracticeAssignmentDoc
+
+Names re-exported here are resolved lazily (PEP 562): a submodule is only
+imported the first time one of its names is accessed on the package.
 """
 
-from .smart_guitar import *
-from .sandbox_schemas import *
-from .groove_layer import *
-from .clip_bundle import *
-from .generation import *
-from .technique_sidecar import *
-from .adaptive_feedback import *
-from .practice_assignment import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
 
 __version__ = "1.6.0"
+
+_LAZY: Dict[str, str] = {
+    # smart_guitar
+    "SmartGuitarStatus": "smart_guitar",
+    "MidiProtocol": "smart_guitar",
+    "AudioOutput": "smart_guitar",
+    "MidiProtocolValue": "smart_guitar",
+    "AudioOutputValue": "smart_guitar",
+    "ToolpathType": "smart_guitar",
+    "SmartGuitarComponent": "smart_guitar",
+    "SmartGuitarIoT": "smart_guitar",
+    "SmartGuitarConnectivity": "smart_guitar",
+    "SmartGuitarAudio": "smart_guitar",
+    "SmartGuitarSensors": "smart_guitar",
+    "SmartGuitarPower": "smart_guitar",
+    "SmartGuitarCamFeatures": "smart_guitar",
+    "SmartGuitarToolpath": "smart_guitar",
+    "SmartGuitarHardware": "smart_guitar",
+    "SmartGuitarSoftware": "smart_guitar",
+    "SmartGuitarArchitecture": "smart_guitar",
+    "SmartGuitarInfo": "smart_guitar",
+    "DawPartner": "smart_guitar",
+    "SmartGuitarDawIntegration": "smart_guitar",
+    "SmartGuitarRegistryEntry": "smart_guitar",
+    "SmartGuitarHealthResponse": "smart_guitar",
+    "SmartGuitarToolpathsResponse": "smart_guitar",
+    "SmartGuitarResource": "smart_guitar",
+    "SmartGuitarBundleResponse": "smart_guitar",
+    "SMART_GUITAR_FEATURES": "smart_guitar",
+    "SMART_GUITAR_COMPONENTS": "smart_guitar",
+    "get_default_registry_entry": "smart_guitar",
+    "get_default_info": "smart_guitar",
+    "get_default_health": "smart_guitar",
+    "get_default_bundle": "smart_guitar",
+    "get_default_toolpaths": "smart_guitar",
+    "get_default_health_json": "smart_guitar",
+    "get_default_info_json": "smart_guitar",
+    "get_default_bundle_json": "smart_guitar",
+    "get_default_toolpaths_json": "smart_guitar",
+    # sandbox_schemas (also wins the SmartGuitarSpec / DEFAULT_TOOLPATHS name
+    # collisions, matching the old star-import order)
+    "CONTRACT_VERSION": "sandbox_schemas",
+    "ModelVariant": "sandbox_schemas",
+    "Handedness": "sandbox_schemas",
+    "Connectivity": "sandbox_schemas",
+    "Feature": "sandbox_schemas",
+    "UnitSystem": "sandbox_schemas",
+    "Vec2": "sandbox_schemas",
+    "BBox3D": "sandbox_schemas",
+    "Clearance": "sandbox_schemas",
+    "Mounting": "sandbox_schemas",
+    "ElectronicsComponent": "sandbox_schemas",
+    "PowerSpec": "sandbox_schemas",
+    "ThermalSpec": "sandbox_schemas",
+    "BodyDims": "sandbox_schemas",
+    "SmartGuitarSpec": "sandbox_schemas",
+    "PlanWarning": "sandbox_schemas",
+    "PlanError": "sandbox_schemas",
+    "CavityKind": "sandbox_schemas",
+    "CavityPlan": "sandbox_schemas",
+    "ChannelKind": "sandbox_schemas",
+    "ChannelPlan": "sandbox_schemas",
+    "BracketPlan": "sandbox_schemas",
+    "ToolpathOp": "sandbox_schemas",
+    "SmartCamPlan": "sandbox_schemas",
+    "DEFAULT_TOOLPATHS": "sandbox_schemas",
+    "ELECTRONICS_LIST_ADAPTER": "sandbox_schemas",
+    "CAVITY_LIST_ADAPTER": "sandbox_schemas",
+    "TOOLPATH_OP_LIST_ADAPTER": "sandbox_schemas",
+    "parse_electronics_json": "sandbox_schemas",
+    "parse_cavities_json": "sandbox_schemas",
+    "parse_toolpath_ops_json": "sandbox_schemas",
+    # groove_layer
+    "TimingBiasV1": "groove_layer",
+    "TempoStabilityV1": "groove_layer",
+    "SubdivisionFidelityV1": "groove_layer",
+    "ErrorRecoveryV1": "groove_layer",
+    "GrooveElasticityV1": "groove_layer",
+    "ConfidenceBandV1": "groove_layer",
+    "EvidenceWindowV1": "groove_layer",
+    "GrooveProfileV1": "groove_layer",
+    "TempoControlV1": "groove_layer",
+    "TimingControlV1": "groove_layer",
+    "DynamicsControlV1": "groove_layer",
+    "RecoveryControlV1": "groove_layer",
+    "GrooveControlIntentV1": "groove_layer",
+    # clip_bundle
+    "ClipArtifact": "clip_bundle",
+    "ClipValidationSummary": "clip_bundle",
+    "ClipAttempt": "clip_bundle",
+    "ClipRunLog": "clip_bundle",
+    "ClipBundle": "clip_bundle",
+    # generation
+    "HarmonySpec": "generation",
+    "StyleSpec": "generation",
+    "TritoneSpec": "generation",
+    "GenerationConstraints": "generation",
+    "GenerationRequest": "generation",
+    "MidiArtifact": "generation",
+    "JsonArtifact": "generation",
+    "ValidationReport": "generation",
+    "RunLog": "generation",
+    "GenerationResult": "generation",
+    # technique_sidecar
+    "TechniqueRole": "technique_sidecar",
+    "TechniqueAnnotation": "technique_sidecar",
+    "TechniqueSidecar": "technique_sidecar",
+    # adaptive_feedback
+    "DiagnosisCode": "adaptive_feedback",
+    "DifficultyProfile": "adaptive_feedback",
+    "PerformanceMetrics": "adaptive_feedback",
+    "RecommendedAdjustments": "adaptive_feedback",
+    "AdaptiveFeedbackV1": "adaptive_feedback",
+    "AdjustableParam": "adaptive_feedback",
+    "RegenerationRequestV1": "adaptive_feedback",
+    "RegenerationResponseV1": "adaptive_feedback",
+    "RegenerationLineage": "adaptive_feedback",
+    # practice_assignment
+    "PracticeAssignmentDoc": "practice_assignment",
+    "PracticeAssignmentInner": "practice_assignment",
+    "PracticeLineage": "practice_assignment",
+}
+
+# Static view of the lazy re-exports for type checkers; keep in sync with _LAZY
+if TYPE_CHECKING:
+    from .smart_guitar import (
+        SmartGuitarStatus,
+        MidiProtocol,
+        AudioOutput,
+        MidiProtocolValue,
+        AudioOutputValue,
+        ToolpathType,
+        SmartGuitarComponent,
+        SmartGuitarIoT,
+        SmartGuitarConnectivity,
+        SmartGuitarAudio,
+        SmartGuitarSensors,
+        SmartGuitarPower,
+        SmartGuitarCamFeatures,
+        SmartGuitarToolpath,
+        SmartGuitarHardware,
+        SmartGuitarSoftware,
+        SmartGuitarArchitecture,
+        SmartGuitarInfo,
+        DawPartner,
+        SmartGuitarDawIntegration,
+        SmartGuitarRegistryEntry,
+        SmartGuitarHealthResponse,
+        SmartGuitarToolpathsResponse,
+        SmartGuitarResource,
+        SmartGuitarBundleResponse,
+        SMART_GUITAR_FEATURES,
+        SMART_GUITAR_COMPONENTS,
+        get_default_registry_entry,
+        get_default_info,
+        get_default_health,
+        get_default_bundle,
+        get_default_toolpaths,
+        get_default_health_json,
+        get_default_info_json,
+        get_default_bundle_json,
+        get_default_toolpaths_json,
+    )
+    from .sandbox_schemas import (
+        CONTRACT_VERSION,
+        ModelVariant,
+        Handedness,
+        Connectivity,
+        Feature,
+        UnitSystem,
+        Vec2,
+        BBox3D,
+        Clearance,
+        Mounting,
+        ElectronicsComponent,
+        PowerSpec,
+        ThermalSpec,
+        BodyDims,
+        SmartGuitarSpec,
+        PlanWarning,
+        PlanError,
+        CavityKind,
+        CavityPlan,
+        ChannelKind,
+        ChannelPlan,
+        BracketPlan,
+        ToolpathOp,
+        SmartCamPlan,
+        DEFAULT_TOOLPATHS,
+        ELECTRONICS_LIST_ADAPTER,
+        CAVITY_LIST_ADAPTER,
+        TOOLPATH_OP_LIST_ADAPTER,
+        parse_electronics_json,
+        parse_cavities_json,
+        parse_toolpath_ops_json,
+    )
+    from .groove_layer import (
+        TimingBiasV1,
+        TempoStabilityV1,
+        SubdivisionFidelityV1,
+        ErrorRecoveryV1,
+        GrooveElasticityV1,
+        ConfidenceBandV1,
+        EvidenceWindowV1,
+        GrooveProfileV1,
+        TempoControlV1,
+        TimingControlV1,
+        DynamicsControlV1,
+        RecoveryControlV1,
+        GrooveControlIntentV1,
+    )
+    from .clip_bundle import (
+        ClipArtifact,
+        ClipValidationSummary,
+        ClipAttempt,
+        ClipRunLog,
+        ClipBundle,
+    )
+    from .generation import (
+        HarmonySpec,
+        StyleSpec,
+        TritoneSpec,
+        GenerationConstraints,
+        GenerationRequest,
+        MidiArtifact,
+        JsonArtifact,
+        ValidationReport,
+        RunLog,
+        GenerationResult,
+    )
+    from .technique_sidecar import (
+        TechniqueRole,
+        TechniqueAnnotation,
+        TechniqueSidecar,
+    )
+    from .adaptive_feedback import (
+        DiagnosisCode,
+        DifficultyProfile,
+        PerformanceMetrics,
+        RecommendedAdjustments,
+        AdaptiveFeedbackV1,
+        AdjustableParam,
+        RegenerationRequestV1,
+        RegenerationResponseV1,
+        RegenerationLineage,
+    )
+    from .practice_assignment import (
+        PracticeAssignmentDoc,
+        PracticeAssignmentInner,
+        PracticeLineage,
+    )
+
+# Submodules the old star imports bound as package attributes
+_SUBMODULES = frozenset(_LAZY.values())
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # Importing a submodule binds it in the package namespace
+        return import_module(f".{name}", __name__)
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
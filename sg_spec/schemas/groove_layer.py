@@ -18,9 +18,13 @@ Version: 1.1.0 (synced to sg-coach contracts v1)
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal, List, Tuple
+from typing import Annotated, Any, Literal, List, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeFloat, NonNegativeInt
+
+
+# Shared constrained types: one annotation per constraint, reused by every field
+UnitFloat = Annotated[float, Field(ge=0.0, le=1.0)]
 
 
 # -------------------------
@@ -54,7 +58,7 @@ class TimingBiasV1(BaseModel):
     mean_offset_ms: float
     stddev_ms: float
     direction: Literal["ahead", "behind", "neutral"]
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: UnitFloat
 
 
 class TempoStabilityV1(BaseModel):
@@ -62,8 +66,8 @@ class TempoStabilityV1(BaseModel):
 
     supported_bpm_range: Tuple[float, float]
     drift_slope: float
-    fatigue_sensitivity: float = Field(ge=0.0, le=1.0)
-    confidence: float = Field(ge=0.0, le=1.0)
+    fatigue_sensitivity: UnitFloat
+    confidence: UnitFloat
 
 
 class SubdivisionFidelityV1(BaseModel):
@@ -71,38 +75,38 @@ class SubdivisionFidelityV1(BaseModel):
 
     supported: List[str]
     unstable: List[str] = Field(default_factory=list)
-    swing_tolerance: float = Field(ge=0.0, le=1.0)
-    confidence: float = Field(ge=0.0, le=1.0)
+    swing_tolerance: UnitFloat
+    confidence: UnitFloat
 
 
 class ErrorRecoveryV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     mean_recovery_beats: float
-    panic_probability: float = Field(ge=0.0, le=1.0)
-    self_correction_rate: float = Field(ge=0.0, le=1.0)
+    panic_probability: UnitFloat
+    self_correction_rate: UnitFloat
 
 
 class GrooveElasticityV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     microtiming_flex_ms: float
-    lock_threshold: float = Field(ge=0.0, le=1.0)
+    lock_threshold: UnitFloat
     push_pull_balance: Literal["push", "pull", "balanced"]
 
 
 class ConfidenceBandV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    lower: float = Field(ge=0.0, le=1.0)
-    upper: float = Field(ge=0.0, le=1.0)
+    lower: UnitFloat
+    upper: UnitFloat
 
 
 class EvidenceWindowV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    sessions: int = Field(ge=0)
-    events: int = Field(ge=0)
+    sessions: NonNegativeInt
+    events: NonNegativeInt
 
 
 class GrooveProfileV1(_ContractBase):
@@ -130,7 +134,7 @@ class TempoControlV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     target_bpm: float
-    lock_strength: float = Field(ge=0.0, le=1.0)
+    lock_strength: UnitFloat
     drift_correction: Literal["none", "soft", "aggressive"]
 
 
@@ -144,15 +148,15 @@ class TimingControlV1(BaseModel):
 class DynamicsControlV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    assist_gain: float = Field(ge=0.0, le=1.0)
-    expression_window: float = Field(ge=0.0, le=1.0)
+    assist_gain: UnitFloat
+    expression_window: UnitFloat
 
 
 class RecoveryControlV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     enabled: bool
-    grace_beats: float = Field(ge=0.0)
+    grace_beats: NonNegativeFloat
 
 
 class GrooveControlIntentV1(_ContractBase):
@@ -165,7 +169,7 @@ class GrooveControlIntentV1(_ContractBase):
     generated_at_utc: datetime
     horizon_ms: int = Field(ge=50, le=60000)
 
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: UnitFloat
     control_modes: List[Literal["follow", "assist", "stabilize", "challenge", "recover"]]
 
     tempo: TempoControlV1
@@ -4,15 +4,30 @@ Smart Guitar Sandbox Schemas
 
 Manufacturing-focused schemas for Smart Guitar variants.
 
+Units are fixed by field-name suffix (``*_in`` inches, ``*_mm`` millimetres);
+there is no runtime unit switch. UnitSystem is kept only as a label.
+
+JSON ingestion: feed raw request bytes to ``Model.parse_json`` (or
+``model_validate_json``) rather than ``model_validate(json.loads(...))``,
+which builds an intermediate dict and then walks it a second time.
+
 Contract Version: 1.0
 """
 
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, conint, confloat
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    PositiveFloat,
+    TypeAdapter,
+)
 
 
 CONTRACT_VERSION = "1.0"
@@ -72,22 +87,32 @@ class Vec2(BaseModel):
 
 class BBox3D(BaseModel):
     """Component bounding box in mm."""
-    w_mm: confloat(gt=0) = Field(..., description="Width (X) in mm")
-    d_mm: confloat(gt=0) = Field(..., description="Depth (Y) in mm")
-    h_mm: confloat(gt=0) = Field(..., description="Height (Z) in mm")
+    w_mm: PositiveFloat = Field(..., description="Width (X) in mm")
+    d_mm: PositiveFloat = Field(..., description="Depth (Y) in mm")
+    h_mm: PositiveFloat = Field(..., description="Height (Z) in mm")
 
 
 class Clearance(BaseModel):
     """Component clearance."""
-    margin_mm: confloat(ge=0) = Field(3.0)
-    cable_bend_mm: confloat(ge=0) = Field(8.0)
+    model_config = ConfigDict(frozen=True)
+
+    margin_mm: NonNegativeFloat = Field(default=3.0)
+    cable_bend_mm: NonNegativeFloat = Field(default=8.0)
 
 
 class Mounting(BaseModel):
     """Mounting reference."""
+    model_config = ConfigDict(frozen=True)
+
     plane: Literal["pod_lid", "pod_floor", "body_spine", "body_floor"] = "pod_floor"
     fastener: Literal["m2_5", "m3", "wood_screw", "standoff"] = "m3"
-    standoff_mm: confloat(ge=0) = 6.0
+    standoff_mm: NonNegativeFloat = 6.0
+
+
+# Frozen, so one default instance is shared by every component that does not
+# override it.
+_DEFAULT_CLEARANCE = Clearance()
+_DEFAULT_MOUNTING = Mounting()
 
 
 class ElectronicsComponent(BaseModel):
@@ -95,8 +120,8 @@ class ElectronicsComponent(BaseModel):
     id: str
     name: str
     bbox: BBox3D
-    clearance: Clearance = Field(default_factory=Clearance)
-    mounting: Mounting = Field(default_factory=Mounting)
+    clearance: Clearance = _DEFAULT_CLEARANCE
+    mounting: Mounting = _DEFAULT_MOUNTING
     notes: List[str] = Field(default_factory=list)
 
 
@@ -118,19 +143,22 @@ class ThermalSpec(BaseModel):
 
 
 class BodyDims(BaseModel):
-    """Body dimension constraints."""
-    units: UnitSystem = UnitSystem.inch
-    thickness_in: confloat(gt=0) = 1.50
-    top_skin_in: confloat(gt=0) = 0.30
-    back_skin_in: confloat(gt=0) = 0.18
-    rim_in: confloat(gt=0) = 0.50
-    spine_w_in: confloat(gt=0) = 1.50
+    """Body dimension constraints (inches)."""
+    thickness_in: PositiveFloat = 1.50
+    top_skin_in: PositiveFloat = 0.30
+    back_skin_in: PositiveFloat = 0.18
+    rim_in: PositiveFloat = 0.50
+    spine_w_in: PositiveFloat = 1.50
 
 
 # =============================================================================
 # SMART GUITAR SPEC
 # =============================================================================
 
+# Immutable prototypes copied per instance with a single list() call.
+_DEFAULT_CONNECTIVITY = (Connectivity.WIRELESS, Connectivity.USB)
+_DEFAULT_FEATURES = (Feature.DAW_MODE, Feature.RECORDING)
+
 
 class SmartGuitarSpec(BaseModel):
     """Smart Guitar design specification."""
@@ -141,10 +169,10 @@ class SmartGuitarSpec(BaseModel):
     handedness: Handedness = Handedness.RH
 
     connectivity: List[Connectivity] = Field(
-        default_factory=lambda: [Connectivity.WIRELESS, Connectivity.USB]
+        default_factory=partial(list, _DEFAULT_CONNECTIVITY)
     )
     features: List[Feature] = Field(
-        default_factory=lambda: [Feature.DAW_MODE, Feature.RECORDING]
+        default_factory=partial(list, _DEFAULT_FEATURES)
     )
 
     body: BodyDims = Field(default_factory=BodyDims)
@@ -154,10 +182,15 @@ class SmartGuitarSpec(BaseModel):
     electronics: List[ElectronicsComponent] = Field(default_factory=list)
 
     # CAM projection parameters
-    target_hollow_depth_in: confloat(gt=0) = 1.05
-    pod_depth_in: confloat(gt=0) = 1.20
-    pickup_depth_in: confloat(gt=0) = 0.75
-    rear_cover_recess_in: confloat(gt=0) = 0.12
+    target_hollow_depth_in: PositiveFloat = 1.05
+    pod_depth_in: PositiveFloat = 1.20
+    pickup_depth_in: PositiveFloat = 0.75
+    rear_cover_recess_in: PositiveFloat = 0.12
+
+    @classmethod
+    def parse_json(cls, data: Union[str, bytes, bytearray]) -> SmartGuitarSpec:
+        """Parse and validate a raw JSON body in a single pydantic-core pass."""
+        return cls.model_validate_json(data)
 
 
 # =============================================================================
@@ -246,6 +279,11 @@ class SmartCamPlan(BaseModel):
     warnings: List[PlanWarning] = Field(default_factory=list)
     errors: List[PlanError] = Field(default_factory=list)
 
+    @classmethod
+    def parse_json(cls, data: Union[str, bytes, bytearray]) -> SmartCamPlan:
+        """Parse and validate a raw JSON body in a single pydantic-core pass."""
+        return cls.model_validate_json(data)
+
 
 # =============================================================================
 # DEFAULT TOOLPATH PARAMETERS
@@ -262,3 +300,31 @@ DEFAULT_TOOLPATHS: Dict[str, Dict[str, Any]] = {
     "T2_1_4_DOWNCUT": {"max_stepdown_in": 0.1875, "stepover_in": 0.12},
     "T3_1_8_UPCUT": {"max_stepdown_in": 0.0625, "stepover_in": 0.06},
 }
+
+
+# =============================================================================
+# BULK INGEST ADAPTERS
+# =============================================================================
+# Built once at import; building a validator is expensive, reusing it is cheap.
+# Do not construct TypeAdapter(...) per call in hot paths - use these instead.
+
+ELECTRONICS_LIST_ADAPTER: TypeAdapter[List[ElectronicsComponent]] = TypeAdapter(
+    List[ElectronicsComponent]
+)
+CAVITY_LIST_ADAPTER: TypeAdapter[List[CavityPlan]] = TypeAdapter(List[CavityPlan])
+TOOLPATH_OP_LIST_ADAPTER: TypeAdapter[List[ToolpathOp]] = TypeAdapter(List[ToolpathOp])
+
+
+def parse_electronics_json(data: Union[str, bytes, bytearray]) -> List[ElectronicsComponent]:
+    """Validate a raw JSON array of electronics components."""
+    return ELECTRONICS_LIST_ADAPTER.validate_json(data)
+
+
+def parse_cavities_json(data: Union[str, bytes, bytearray]) -> List[CavityPlan]:
+    """Validate a raw JSON array of cavity plans."""
+    return CAVITY_LIST_ADAPTER.validate_json(data)
+
+
+def parse_toolpath_ops_json(data: Union[str, bytes, bytearray]) -> List[ToolpathOp]:
+    """Validate a raw JSON array of toolpath operations."""
+    return TOOLPATH_OP_LIST_ADAPTER.validate_json(data)
@@ -0,0 +1,77 @@
+"""
+Unit tests for sg_spec.schemas.groove_layer
+
+Run with: python -m pytest sg_spec/tests/test_groove_layer.py -v
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from sg_spec.schemas import groove_layer as gl
+
+GROOVE_PROFILE = {
+    "profile_id": "p1",
+    "scope": "device_local",
+    "timing_bias": {"mean_offset_ms": 4.0, "stddev_ms": 9.0, "direction": "ahead", "confidence": 0.7},
+    "tempo_stability": {
+        "supported_bpm_range": (70.0, 140.0), "drift_slope": 0.1,
+        "fatigue_sensitivity": 0.2, "confidence": 0.6,
+    },
+    "subdivision_fidelity": {
+        "supported": ["8th", "16th"], "unstable": ["triplet"],
+        "swing_tolerance": 0.3, "confidence": 0.5,
+    },
+    "error_recovery": {"mean_recovery_beats": 2.0, "panic_probability": 0.1, "self_correction_rate": 0.8},
+    "groove_elasticity": {"microtiming_flex_ms": 12.0, "lock_threshold": 0.5, "push_pull_balance": "push"},
+    "confidence_band": {"lower": 0.4, "upper": 0.9},
+    "evidence_window": {"sessions": 3, "events": 420},
+}
+
+GROOVE_INTENT = {
+    "intent_id": "i1",
+    "profile_id": "p1",
+    "generated_at_utc": datetime(2026, 1, 13, tzinfo=timezone.utc),
+    "horizon_ms": 2000,
+    "confidence": 0.8,
+    "control_modes": ["follow", "stabilize"],
+    "tempo": {"target_bpm": 96.0, "lock_strength": 0.6, "drift_correction": "soft"},
+    "timing": {"microshift_ms": -3.0, "anticipation_bias": "behind"},
+    "dynamics": {"assist_gain": 0.4, "expression_window": 0.5},
+    "recovery": {"enabled": True, "grace_beats": 2.0},
+    "reason_codes": ["drift_detected"],
+}
+
+
+@pytest.mark.parametrize(
+    "model_cls, payload, out_of_range",
+    [
+        (gl.GrooveProfileV1, GROOVE_PROFILE, {"confidence_band": {"lower": 2.0, "upper": 0.9}}),
+        (gl.GrooveControlIntentV1, GROOVE_INTENT, {"confidence": 2.0}),
+    ],
+    ids=["GrooveProfileV1", "GrooveControlIntentV1"],
+)
+class TestGrooveContracts:
+    """Groove-layer contracts round-trip through model_validate and stay strict."""
+
+    def test_round_trip_builds_sub_models(self, model_cls, payload, out_of_range):
+        validated = model_cls.model_validate(payload)
+        rebuilt = model_cls.model_validate(validated.model_dump())
+        assert rebuilt == validated
+        for name, field in model_cls.model_fields.items():
+            if isinstance(field.annotation, type) and issubclass(field.annotation, BaseModel):
+                assert isinstance(getattr(rebuilt, name), field.annotation)
+
+    def test_model_validate_rejects_out_of_range(self, model_cls, payload, out_of_range):
+        with pytest.raises(ValidationError):
+            model_cls.model_validate({**payload, **out_of_range})
+
+    def test_model_validate_rejects_unknown_keys(self, model_cls, payload, out_of_range):
+        with pytest.raises(ValidationError):
+            model_cls.model_validate({**payload, "unexpected": 1})
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
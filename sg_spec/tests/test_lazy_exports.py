@@ -0,0 +1,81 @@
+"""
+Unit tests for the PEP 562 lazy re-exports in sg_spec.schemas
+
+Run with: python -m pytest sg_spec/tests/test_lazy_exports.py -v
+"""
+
+import ast
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import sg_spec.schemas
+
+# generation imports sg_spec.ai.coach, which is not shipped in this package
+UNIMPORTABLE_MODULES = {"generation"}
+
+
+def _lazy_entries(package):
+    return [
+        pytest.param(package, name, module, id=f"{package.__name__}.{name}")
+        for name, module in package._LAZY.items()
+        if module not in UNIMPORTABLE_MODULES
+    ]
+
+
+def _type_checking_imports(package):
+    """Map name -> submodule for the imports under `if TYPE_CHECKING:`."""
+    tree = ast.parse(Path(package.__file__).read_text(encoding="utf-8"))
+    block = next(
+        node for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+    return {
+        alias.name: stmt.module
+        for stmt in block.body
+        if isinstance(stmt, ast.ImportFrom)
+        for alias in stmt.names
+    }
+
+
+class TestSchemasLazyExports:
+    """sg_spec.schemas resolves every _LAZY name from its owning submodule."""
+
+    @pytest.mark.parametrize("package, name, module", _lazy_entries(sg_spec.schemas))
+    def test_entry_resolves(self, package, name, module):
+        submodule = importlib.import_module(f"{package.__name__}.{module}")
+        assert getattr(package, name) is getattr(submodule, name)
+
+    def test_all_matches_lazy(self):
+        assert sg_spec.schemas.__all__ == list(sg_spec.schemas._LAZY)
+
+    def test_type_checking_block_matches_lazy(self):
+        assert _type_checking_imports(sg_spec.schemas) == sg_spec.schemas._LAZY
+
+    @pytest.mark.parametrize(
+        "name", sorted(sg_spec.schemas._SUBMODULES - UNIMPORTABLE_MODULES)
+    )
+    def test_submodules_resolve_as_attributes(self, name):
+        submodule = importlib.import_module(f"sg_spec.schemas.{name}")
+        assert getattr(sg_spec.schemas, name) is submodule
+        assert name in dir(sg_spec.schemas)
+
+    def test_submodule_resolves_in_fresh_interpreter(self):
+        """Attribute access alone (no prior submodule import) must resolve."""
+        code = (
+            "import sg_spec.schemas, types; "
+            "assert isinstance(sg_spec.schemas.groove_layer, types.ModuleType)"
+        )
+        repo_root = Path(sg_spec.schemas.__file__).resolve().parents[2]
+        subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            sg_spec.schemas.NoSuchSchema
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
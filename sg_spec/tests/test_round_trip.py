@@ -0,0 +1,100 @@
+"""
+Round-trip tests for the smart-guitar and sandbox schema models
+
+Run with: python -m pytest sg_spec/tests/test_round_trip.py -v
+"""
+
+import pytest
+
+from sg_spec.schemas import sandbox_schemas as sandbox
+from sg_spec.schemas import smart_guitar as sg
+
+
+def _sample_models():
+    """One populated instance per top-level model, with nested lists."""
+    return [
+        sg.SmartGuitarSpec(fret_count=22, status=sg.SmartGuitarStatus.STUB),
+        sg.SmartGuitarInfo(related_endpoints={"spec": "/spec"}),
+        sg.SmartGuitarRegistryEntry(
+            iot=sg.SmartGuitarIoT(memory_gb=4),
+            connectivity=sg.SmartGuitarConnectivity(midi=("din", "usb")),
+            audio=sg.SmartGuitarAudio(outputs=("analog",)),
+            features=["led_markers"],
+        ),
+        sg.SmartGuitarHealthResponse(capabilities=["toolpaths"]),
+        sg.SmartGuitarToolpathsResponse(toolpaths=sg.DEFAULT_TOOLPATHS),
+        sg.SmartGuitarBundleResponse(
+            resources=[sg.SmartGuitarResource(name="Manual", type="documentation", path="a.pdf")]
+        ),
+        sandbox.SmartGuitarSpec(
+            model_id="sg-1",
+            electronics=[
+                sandbox.ElectronicsComponent(
+                    id="pi", name="Pi", bbox=sandbox.BBox3D(w_mm=85, d_mm=56, h_mm=17),
+                    mounting=sandbox.Mounting(fastener="m2_5"), notes=["main board"],
+                )
+            ],
+        ),
+        sandbox.SmartCamPlan(
+            model_id="sg-1",
+            model_variant=sandbox.ModelVariant.headless,
+            handedness=sandbox.Handedness.LH,
+            cavities=[sandbox.CavityPlan(kind=sandbox.CavityKind.pod, depth_in=1.2, template_id="pod")],
+            brackets=[sandbox.BracketPlan(component_id="pi", template_id="b1")],
+            channels=[sandbox.ChannelPlan(kind=sandbox.ChannelKind.route, template_id="c1")],
+            ops=[
+                sandbox.ToolpathOp(
+                    op_id="op1", title="Pod", tool="t1",
+                    max_stepdown_in=0.1, stepover_in=0.2, depth_in=1.2,
+                )
+            ],
+            warnings=[sandbox.PlanWarning(code="W1", message="check")],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("model", _sample_models(), ids=lambda m: type(m).__qualname__)
+class TestValidateRoundTrip:
+    """Dumped payloads validate back into an equal model."""
+
+    def test_python_round_trip(self, model):
+        rebuilt = type(model).model_validate(model.model_dump())
+        assert type(rebuilt) is type(model)
+        assert rebuilt == model
+
+    def test_json_round_trip(self, model):
+        rebuilt = type(model).model_validate_json(model.model_dump_json())
+        assert rebuilt == model
+
+    def test_nested_models_are_instances(self, model):
+        rebuilt = type(model).model_validate(model.model_dump(mode="json"))
+        for name in type(model).model_fields:
+            original, value = getattr(model, name), getattr(rebuilt, name)
+            if isinstance(original, list):
+                assert [type(v) for v in value] == [type(v) for v in original]
+            else:
+                assert type(value) is type(original)
+
+
+class TestTupleFields:
+    """Tuple fields come back as tuples, even from JSON-mode dumps."""
+
+    def test_json_mode_lists_become_tuples(self):
+        entry = sg.SmartGuitarRegistryEntry(
+            connectivity=sg.SmartGuitarConnectivity(midi=("din",)),
+        )
+        rebuilt = sg.SmartGuitarRegistryEntry.model_validate(entry.model_dump(mode="json"))
+        assert rebuilt.connectivity.midi == ("din",)
+        assert rebuilt.audio.outputs == ("analog", "usb", "wireless")
+        # frozen sub-models must stay hashable
+        hash(rebuilt.connectivity)
+        hash(rebuilt.audio)
+
+    def test_missing_fields_share_frozen_defaults(self):
+        rebuilt = sg.SmartGuitarRegistryEntry.model_validate({"display_name": "X"})
+        assert rebuilt.display_name == "X"
+        assert rebuilt.connectivity is sg._DEFAULT_CONNECTIVITY
+        assert rebuilt.model_fields_set == {"display_name"}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""
+Unit tests for defaults in sg_spec.schemas.smart_guitar
+
+Run with: python -m pytest sg_spec/tests/test_smart_guitar_defaults.py -v
+"""
+
+from typing import get_args
+
+import pytest
+
+from sg_spec.schemas.smart_guitar import (
+    AudioOutput,
+    AudioOutputValue,
+    MidiProtocol,
+    MidiProtocolValue,
+    SmartGuitarArchitecture,
+    SmartGuitarAudio,
+    SmartGuitarBundleResponse,
+    SmartGuitarConnectivity,
+    SmartGuitarHealthResponse,
+    SmartGuitarInfo,
+    get_default_bundle,
+    get_default_bundle_json,
+    get_default_health,
+    get_default_health_json,
+    get_default_info,
+    get_default_info_json,
+)
+
+
+class TestDefaultResponseCache:
+    """get_default_*() is shared; get_default_*_json() must not depend on it."""
+
+    def test_instances_are_shared(self):
+        assert get_default_health() is get_default_health()
+        assert get_default_info() is get_default_info()
+
+    def test_deep_copy_isolates_shared_instance(self):
+        copy = get_default_health().model_copy(deep=True)
+        copy.capabilities.append("leak")
+        assert "leak" not in get_default_health().capabilities
+
+    @pytest.mark.parametrize(
+        "shared, cached_json, model_cls",
+        [
+            (get_default_health, get_default_health_json, SmartGuitarHealthResponse),
+            (get_default_info, get_default_info_json, SmartGuitarInfo),
+            (get_default_bundle, get_default_bundle_json, SmartGuitarBundleResponse),
+        ],
+    )
+    def test_json_ignores_mutated_shared_instance(self, shared, cached_json, model_cls):
+        instance = shared()
+        saved = instance.model_copy(deep=True)
+        instance.ok = False
+        cached_json.cache_clear()
+        try:
+            assert cached_json() == model_cls().model_dump_json().encode("utf-8")
+        finally:
+            instance.ok = saved.ok
+            cached_json.cache_clear()
+
+
+class TestArchitectureDefaults:
+    """Default hardware/software sections are private per instance."""
+
+    def test_connectivity_list_not_shared(self):
+        a = SmartGuitarArchitecture()
+        b = SmartGuitarArchitecture()
+        a.hardware["connectivity"].append("bluetooth")
+        assert b.hardware["connectivity"] == ["wired", "wireless"]
+
+    def test_default_shape(self):
+        assert SmartGuitarArchitecture().model_dump() == {
+            "hardware": {
+                "compute": "embedded",
+                "connectivity": ["wired", "wireless"],
+                "audio": "high_resolution",
+            },
+            "software": {"os": "linux"},
+        }
+
+
+class TestLiteralValueTypes:
+    """Literal field types and their defaults stay in sync with the Enums."""
+
+    def test_literal_values_match_enums(self):
+        assert set(get_args(MidiProtocolValue)) == {m.value for m in MidiProtocol}
+        assert set(get_args(AudioOutputValue)) == {a.value for a in AudioOutput}
+
+    def test_defaults_are_str_tuples(self):
+        assert SmartGuitarConnectivity().midi == (
+            MidiProtocol.USB_MIDI.value,
+            MidiProtocol.WIRELESS_MIDI.value,
+        )
+        assert SmartGuitarAudio().outputs == tuple(a.value for a in AudioOutput)
+        assert SmartGuitarConnectivity().model_dump()["midi"] == ("usb", "wireless")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])